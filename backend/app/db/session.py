@@ -3,7 +3,7 @@ from typing import AsyncGenerator, Optional
 
 from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine, async_sessionmaker, AsyncSession
 from sqlalchemy.orm import declarative_base
-from sqlalchemy.pool import NullPool
+from sqlalchemy.pool import StaticPool
 
 # Base for all models
 Base = declarative_base()
@@ -22,8 +22,18 @@ def get_async_engine_factory() -> AsyncEngine:
     
     engine_args = {
         "echo": True,  # Set to True for SQL query logging, make False or configurable for production
-        "poolclass": NullPool,  # Using NullPool ensures fresh connections, good for tests and can simplify async greenlet issues
     }
+    if ":memory:" in database_url:
+        # An in-memory SQLite database only lives as long as its connection, so every
+        # session must share the one connection.
+        engine_args["poolclass"] = StaticPool
+    elif not database_url.startswith("sqlite"):
+        # Server databases (e.g. MySQL via aiomysql) keep a pool of open connections instead of
+        # connecting per request. pool_pre_ping is left off: it costs a round trip per checkout.
+        engine_args["pool_size"] = int(os.getenv("DB_POOL_SIZE", "10"))
+        engine_args["max_overflow"] = int(os.getenv("DB_MAX_OVERFLOW", "20"))
+        engine_args["pool_recycle"] = int(os.getenv("DB_POOL_RECYCLE_SECONDS", "1800"))
+    # File-based SQLite keeps SQLAlchemy's default queue pool.
     # Note: connect_args for 'check_same_thread' is for the standard sync sqlite3 driver, not needed for aiosqlite.
     return create_async_engine(database_url, **engine_args)
 
@@ -1,4 +1,5 @@
 import uuid
+from types import MappingProxyType
 from typing import List, Optional, AsyncGenerator, Callable, Awaitable
 
 import pytest
@@ -23,6 +24,8 @@ from app.schemas.bia_categories import (
 # Import test helpers
 from app.tests.helpers import (
     DEFAULT_ORG_ID,
+    SECONDARY_ORG_ID,
+    read_bia_category,
     create_role_with_permissions_async,
     create_user_with_roles_async,
 )
@@ -35,46 +38,43 @@ pytestmark = pytest.mark.asyncio
 
 
 # --- Test Data Helper ---
-def get_bia_category_create_payload(name: Optional[str] = None, description: Optional[str] = None, organization_id: Optional[uuid.UUID] = DEFAULT_ORG_ID) -> dict:
-    payload = {
-        "name": name if name is not None else f"Test BIA Category {uuid.uuid4().hex[:10]}",
-        "description": description if description is not None else "A test BIA category description.",
-        "organization_id": str(organization_id) if organization_id else str(DEFAULT_ORG_ID)
-    }
-    return {k: v for k, v in payload.items() if v is not None}
+# Built once at import; read-only so tests can't accidentally change the defaults for each other.
+_BASE_BIA_CATEGORY_PAYLOAD = MappingProxyType({
+    "description": "A test BIA category description.",
+    "organization_id": str(DEFAULT_ORG_ID),
+})
+
+def get_bia_category_create_payload(name: Optional[str] = None, description: Optional[str] = None, organization_id: Optional[uuid.UUID] = None) -> dict:
+    payload = dict(_BASE_BIA_CATEGORY_PAYLOAD, name=name if name is not None else f"Test BIA Category {uuid.uuid4().hex[:10]}")
+    if description is not None:
+        payload["description"] = description
+    if organization_id is not None:
+        payload["organization_id"] = str(organization_id)
+    return payload
 
 
 # --- BIA Category API Test Cases ---
 
 # POST /bia-categories/
 async def test_create_bia_category_as_bcm_manager(
-    bcm_manager_bia_category_client: AsyncClient, 
-    async_db_session: AsyncSession # Added async_db_session for DB verification
+    bcm_manager_bia_category_client: AsyncClient
 ):
     payload = get_bia_category_create_payload()
     response = await bcm_manager_bia_category_client.post("/api/v1/bia-categories/", json=payload)
     assert response.status_code == status.HTTP_201_CREATED
-    data = response.json()
-    assert data["name"] == payload["name"]
-    assert data["description"] == payload["description"]
-    assert data["organization_id"] == payload["organization_id"]
-    assert data["is_active"] is True
-    assert "id" in data
-
-    # Verify in DB
-    category_in_db = await async_db_session.get(BIACategoryModel, uuid.UUID(data["id"]))
-    assert category_in_db is not None
-    assert category_in_db.name == payload["name"]
+    category = read_bia_category(response)
+    assert category.name == payload["name"]
+    assert category.description == payload["description"]
+    assert str(category.organization_id) == payload["organization_id"]
+    assert category.is_active is True
 
 async def test_create_bia_category_as_ciso(
-    ciso_bia_category_client: AsyncClient, 
-    async_db_session: AsyncSession # Added for consistency, though not strictly needed if not verifying DB
+    ciso_bia_category_client: AsyncClient
 ):
     payload = get_bia_category_create_payload(name=f"CISO Created Category {uuid.uuid4().hex[:6]}")
     response = await ciso_bia_category_client.post("/api/v1/bia-categories/", json=payload)
     assert response.status_code == status.HTTP_201_CREATED
-    data = response.json()
-    assert data["name"] == payload["name"]
+    assert read_bia_category(response).name == payload["name"]
 
 async def test_create_bia_category_as_read_only_user_forbidden(
     read_only_bia_category_client: AsyncClient
@@ -102,62 +102,47 @@ async def test_create_bia_category_duplicate_name_for_same_org_conflict(
 
 async def test_create_bia_category_duplicate_name_for_different_org_allowed(
     bcm_manager_bia_category_client: AsyncClient, 
-    async_db_session: AsyncSession
+    secondary_organization: OrganizationModel
 ):
-    org2_id = uuid.uuid4()
-    # Ensure the new organization exists in the DB
-    org2 = OrganizationModel(id=str(org2_id), name="Another Org for BIA Test") # Ensure UUID is string
-    async_db_session.add(org2)
-    await async_db_session.commit() # Commit to make it available
-
     payload1 = get_bia_category_create_payload(name="Shared Name Test", organization_id=DEFAULT_ORG_ID)
     response1 = await bcm_manager_bia_category_client.post("/api/v1/bia-categories/", json=payload1)
     assert response1.status_code == status.HTTP_201_CREATED
     
-    # This part assumes the user (bcm_manager_bia_category_client) has rights to create for org2_id,
+    # This part assumes the user (bcm_manager_bia_category_client) has rights to create for SECONDARY_ORG_ID,
     # or the API allows specifying organization_id in payload and it's honored.
     # If the user is tied to DEFAULT_ORG_ID and cannot create for others, this needs a superadmin client.
     # For now, assuming the API allows it if specified in payload.
-    payload2 = get_bia_category_create_payload(name="Shared Name Test", organization_id=org2_id)
+    payload2 = get_bia_category_create_payload(name="Shared Name Test", organization_id=SECONDARY_ORG_ID)
     response2 = await bcm_manager_bia_category_client.post("/api/v1/bia-categories/", json=payload2)
     assert response2.status_code == status.HTTP_201_CREATED 
-    data1 = response1.json()
-    data2 = response2.json()
-    assert data1["name"] == data2["name"]
-    assert data1["organization_id"] != data2["organization_id"]
-    assert data2["organization_id"] == str(org2_id)
-
-async def test_create_bia_category_missing_name(bcm_manager_bia_category_client: AsyncClient):
-    payload = get_bia_category_create_payload()
-    del payload["name"]
-    response = await bcm_manager_bia_category_client.post("/api/v1/bia-categories/", json=payload, expect_error=True)
-    assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
-
-async def test_create_bia_category_empty_name(bcm_manager_bia_category_client: AsyncClient):
-    payload = get_bia_category_create_payload(name="")
-    response = await bcm_manager_bia_category_client.post("/api/v1/bia-categories/", json=payload, expect_error=True)
-    assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
-
-async def test_create_bia_category_name_too_long(bcm_manager_bia_category_client: AsyncClient):
-    payload = get_bia_category_create_payload(name="a" * 256) # Assuming max_length is 255
-    response = await bcm_manager_bia_category_client.post("/api/v1/bia-categories/", json=payload, expect_error=True)
-    assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
-
-async def test_create_bia_category_description_too_long(bcm_manager_bia_category_client: AsyncClient):
-    payload = get_bia_category_create_payload(description="d" * 1001) # Assuming max_length is 1000
-    response = await bcm_manager_bia_category_client.post("/api/v1/bia-categories/", json=payload, expect_error=True)
-    assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
-
-async def test_create_bia_category_invalid_org_id_format(bcm_manager_bia_category_client: AsyncClient):
+    category1 = read_bia_category(response1)
+    category2 = read_bia_category(response2)
+    assert category1.name == category2.name
+    assert category1.organization_id != category2.organization_id
+    assert category2.organization_id == SECONDARY_ORG_ID
+
+@pytest.mark.parametrize(
+    "mutate_payload",
+    [
+        pytest.param(lambda p: p.pop("name"), id="missing_name"),
+        pytest.param(lambda p: p.update(name=""), id="empty_name"),
+        pytest.param(lambda p: p.update(name="a" * 256), id="name_too_long"), # Assuming max_length is 255
+        pytest.param(lambda p: p.update(description="d" * 1001), id="description_too_long"), # Assuming max_length is 1000
+        pytest.param(lambda p: p.update(organization_id="not-a-uuid"), id="invalid_org_id_format"),
+    ],
+)
+async def test_create_bia_category_invalid_payload(
+    bcm_manager_bia_category_client: AsyncClient,
+    mutate_payload: Callable[[dict], object]
+):
     payload = get_bia_category_create_payload()
-    payload["organization_id"] = "not-a-uuid"
+    mutate_payload(payload)
     response = await bcm_manager_bia_category_client.post("/api/v1/bia-categories/", json=payload, expect_error=True)
     assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
 
 # GET /bia-categories/
 async def test_list_bia_categories_as_bcm_manager(
-    bcm_manager_bia_category_client: AsyncClient,
-    async_db_session: AsyncSession # To ensure data is queryable
+    bcm_manager_bia_category_client: AsyncClient
 ):
     # Create a couple of categories for the default org
     payload1 = get_bia_category_create_payload(name="BIA Cat List 1", organization_id=DEFAULT_ORG_ID)
@@ -179,8 +164,7 @@ async def test_list_bia_categories_as_bcm_manager(
 
 
 async def test_list_bia_categories_as_ciso(
-    ciso_bia_category_client: AsyncClient,
-    async_db_session: AsyncSession 
+    ciso_bia_category_client: AsyncClient
 ):
     payload = get_bia_category_create_payload(name="BIA Cat for CISO List", organization_id=DEFAULT_ORG_ID)
     await ciso_bia_category_client.post("/api/v1/bia-categories/", json=payload)
@@ -217,14 +201,14 @@ async def test_get_bia_category_by_id_as_bcm_manager(
     payload = get_bia_category_create_payload(name="BIA Cat Get By ID")
     create_response = await bcm_manager_bia_category_client.post("/api/v1/bia-categories/", json=payload)
     assert create_response.status_code == status.HTTP_201_CREATED
-    category_id = create_response.json()["id"]
+    category_id = read_bia_category(create_response).id
 
     response = await bcm_manager_bia_category_client.get(f"/api/v1/bia-categories/{category_id}")
     assert response.status_code == status.HTTP_200_OK
-    data = response.json()
-    assert data["id"] == category_id
-    assert data["name"] == payload["name"]
-    assert data["organization_id"] == str(DEFAULT_ORG_ID)
+    category = read_bia_category(response)
+    assert category.id == category_id
+    assert category.name == payload["name"]
+    assert category.organization_id == DEFAULT_ORG_ID
 
 async def test_get_bia_category_by_id_as_read_only_user(
     read_only_bia_category_client: AsyncClient,
@@ -232,12 +216,11 @@ async def test_get_bia_category_by_id_as_read_only_user(
 ):
     payload = get_bia_category_create_payload(name="BIA Cat Get By ID ReadOnly")
     create_response = await bcm_manager_bia_category_client.post("/api/v1/bia-categories/", json=payload)
-    category_id = create_response.json()["id"]
+    category_id = read_bia_category(create_response).id
 
     response = await read_only_bia_category_client.get(f"/api/v1/bia-categories/{category_id}")
     assert response.status_code == status.HTTP_200_OK
-    data = response.json()
-    assert data["id"] == category_id
+    assert read_bia_category(response).id == category_id
 
 async def test_get_bia_category_by_id_as_no_permission_user_forbidden(
     no_bia_category_permissions_client: AsyncClient,
@@ -245,7 +228,7 @@ async def test_get_bia_category_by_id_as_no_permission_user_forbidden(
 ):
     payload = get_bia_category_create_payload(name="BIA Cat Get By ID NoPerm")
     create_response = await bcm_manager_bia_category_client.post("/api/v1/bia-categories/", json=payload)
-    category_id = create_response.json()["id"]
+    category_id = read_bia_category(create_response).id
 
     response = await no_bia_category_permissions_client.get(f"/api/v1/bia-categories/{category_id}", expect_error=True)
     assert response.status_code == status.HTTP_403_FORBIDDEN
@@ -257,21 +240,20 @@ async def test_get_bia_category_by_id_non_existent(bcm_manager_bia_category_clie
 
 async def test_get_bia_category_by_id_from_different_org_forbidden(
     bcm_manager_bia_category_client: AsyncClient, # Belongs to DEFAULT_ORG_ID
+    secondary_organization: OrganizationModel,
     async_db_session: AsyncSession
 ):
     # Create a category in a different organization
-    org2_id = uuid.uuid4()
-    org2 = OrganizationModel(id=str(org2_id), name="Org2 for Get Test")
-    async_db_session.add(org2)
-    
+    creator_id = bcm_manager_bia_category_client.user.id
     category_other_org = BIACategoryModel(
         name="Category in Org2", 
-        organization_id=str(org2_id),
-        description="Belongs to another org"
+        organization_id=SECONDARY_ORG_ID,
+        description="Belongs to another org",
+        created_by_id=creator_id,
+        updated_by_id=creator_id,
     )
     async_db_session.add(category_other_org)
-    await async_db_session.commit()
-    await async_db_session.refresh(category_other_org)
+    await async_db_session.flush() # The API shares this session, so a flush is enough to make it visible
     
     category_id_other_org = category_other_org.id
 
@@ -283,26 +265,20 @@ async def test_get_bia_category_by_id_from_different_org_forbidden(
 
 # PUT /bia-categories/{category_id}
 async def test_update_bia_category_as_bcm_manager(
-    bcm_manager_bia_category_client: AsyncClient,
-    async_db_session: AsyncSession
+    bcm_manager_bia_category_client: AsyncClient
 ):
     payload = get_bia_category_create_payload(name="BIA Cat To Update")
     create_response = await bcm_manager_bia_category_client.post("/api/v1/bia-categories/", json=payload)
-    category_id = create_response.json()["id"]
+    category_id = read_bia_category(create_response).id
 
     update_payload = {"name": "Updated BIA Cat Name", "description": "Updated description."}
     response = await bcm_manager_bia_category_client.put(f"/api/v1/bia-categories/{category_id}", json=update_payload)
     assert response.status_code == status.HTTP_200_OK
-    data = response.json()
-    assert data["id"] == category_id
-    assert data["name"] == update_payload["name"]
-    assert data["description"] == update_payload["description"]
-    assert data["organization_id"] == str(DEFAULT_ORG_ID) # Org ID should not change on update
-
-    # Verify in DB
-    category_in_db = await async_db_session.get(BIACategoryModel, uuid.UUID(category_id))
-    assert category_in_db is not None
-    assert category_in_db.name == update_payload["name"]
+    category = read_bia_category(response)
+    assert category.id == category_id
+    assert category.name == update_payload["name"]
+    assert category.description == update_payload["description"]
+    assert category.organization_id == DEFAULT_ORG_ID # Org ID should not change on update
 
 async def test_update_bia_category_as_read_only_user_forbidden(
     read_only_bia_category_client: AsyncClient,
@@ -310,7 +286,7 @@ async def test_update_bia_category_as_read_only_user_forbidden(
 ):
     payload = get_bia_category_create_payload(name="BIA Cat Update ReadOnly Test")
     create_response = await bcm_manager_bia_category_client.post("/api/v1/bia-categories/", json=payload)
-    category_id = create_response.json()["id"]
+    category_id = read_bia_category(create_response).id
 
     update_payload = {"name": "Attempted Update"}
     response = await read_only_bia_category_client.put(f"/api/v1/bia-categories/{category_id}", json=update_payload, expect_error=True)
@@ -330,7 +306,7 @@ async def test_update_bia_category_to_duplicate_name_conflict(
     
     cat2_payload = get_bia_category_create_payload(name="BIA Cat To Be Updated To Duplicate")
     cat2_res = await bcm_manager_bia_category_client.post("/api/v1/bia-categories/", json=cat2_payload)
-    cat2_id = cat2_res.json()["id"]
+    cat2_id = read_bia_category(cat2_res).id
 
     update_payload = {"name": cat1_payload["name"]} # Try to update cat2 to cat1's name
     response = await bcm_manager_bia_category_client.put(f"/api/v1/bia-categories/{cat2_id}", json=update_payload, expect_error=True)
@@ -343,22 +319,22 @@ async def test_delete_bia_category_as_bcm_manager(
 ):
     payload = get_bia_category_create_payload(name="BIA Cat To Delete")
     create_response = await bcm_manager_bia_category_client.post("/api/v1/bia-categories/", json=payload)
-    category_id = create_response.json()["id"]
+    category_id = read_bia_category(create_response).id
 
     response = await bcm_manager_bia_category_client.delete(f"/api/v1/bia-categories/{category_id}")
     assert response.status_code == status.HTTP_200_OK # Or 204 if no content
-    data = response.json() # Assuming 200 OK with deleted object returned
-    assert data["id"] == category_id
-    assert data["name"] == payload["name"] 
+    category = read_bia_category(response) # Assuming 200 OK with deleted object returned
+    assert category.id == category_id
+    assert category.name == payload["name"] 
     # Optionally, check is_active is False if soft delete, or row is gone if hard delete
     # For soft delete:
-    # assert data["is_active"] is False 
-    # category_in_db = await async_db_session.get(BIACategoryModel, uuid.UUID(category_id))
+    # assert category.is_active is False 
+    # category_in_db = await async_db_session.get(BIACategoryModel, category_id)
     # assert category_in_db is not None
     # assert category_in_db.is_active is False
     
     # For hard delete (current assumption based on typical delete returning object):
-    category_in_db = await async_db_session.get(BIACategoryModel, uuid.UUID(category_id))
+    category_in_db = await async_db_session.get(BIACategoryModel, category_id)
     assert category_in_db is None # Or check for soft delete flag
 
 async def test_delete_bia_category_as_read_only_user_forbidden(
@@ -367,7 +343,7 @@ async def test_delete_bia_category_as_read_only_user_forbidden(
 ):
     payload = get_bia_category_create_payload(name="BIA Cat Delete ReadOnly Test")
     create_response = await bcm_manager_bia_category_client.post("/api/v1/bia-categories/", json=payload)
-    category_id = create_response.json()["id"]
+    category_id = read_bia_category(create_response).id
 
     response = await read_only_bia_category_client.delete(f"/api/v1/bia-categories/{category_id}", expect_error=True)
     assert response.status_code == status.HTTP_403_FORBIDDEN
@@ -384,8 +360,7 @@ async def test_create_bia_category_is_active_defaults_true(bcm_manager_bia_categ
     # Do not specify is_active in payload
     response = await bcm_manager_bia_category_client.post("/api/v1/bia-categories/", json=payload)
     assert response.status_code == status.HTTP_201_CREATED
-    data = response.json()
-    assert data["is_active"] is True
+    assert read_bia_category(response).is_active is True
 
 async def test_update_bia_category_can_set_inactive(
     bcm_manager_bia_category_client: AsyncClient,
@@ -393,26 +368,25 @@ async def test_update_bia_category_can_set_inactive(
 ):
     payload = get_bia_category_create_payload(name="BIA Cat Set Inactive")
     create_response = await bcm_manager_bia_category_client.post("/api/v1/bia-categories/", json=payload)
-    category_id = create_response.json()["id"]
+    category_id = read_bia_category(create_response).id
 
     update_payload = {"is_active": False}
     response = await bcm_manager_bia_category_client.put(f"/api/v1/bia-categories/{category_id}", json=update_payload)
     assert response.status_code == status.HTTP_200_OK
-    data = response.json()
-    assert data["is_active"] is False
+    assert read_bia_category(response).is_active is False
 
-    category_in_db = await async_db_session.get(BIACategoryModel, uuid.UUID(category_id))
+    # The API runs on this same session, so get() is served from the identity map without a SELECT.
+    category_in_db = await async_db_session.get(BIACategoryModel, category_id)
     assert category_in_db is not None
     assert category_in_db.is_active is False
 
 async def test_get_inactive_bia_category_by_id(
-    bcm_manager_bia_category_client: AsyncClient,
-    async_db_session: AsyncSession
+    bcm_manager_bia_category_client: AsyncClient
 ):
     # Create and set inactive
     payload = get_bia_category_create_payload(name="BIA Cat Get Inactive")
     create_res = await bcm_manager_bia_category_client.post("/api/v1/bia-categories/", json=payload)
-    category_id = create_res.json()["id"]
+    category_id = read_bia_category(create_res).id
     await bcm_manager_bia_category_client.put(f"/api/v1/bia-categories/{category_id}", json={"is_active": False})
 
     response = await bcm_manager_bia_category_client.get(f"/api/v1/bia-categories/{category_id}")
@@ -421,13 +395,12 @@ async def test_get_inactive_bia_category_by_id(
     # 2. Returns 404 Not Found (as if it doesn't exist for normal users)
     # Assuming 200 OK for now, as it's often useful for admins to see inactive items.
     assert response.status_code == status.HTTP_200_OK 
-    data = response.json()
-    assert data["id"] == category_id
-    assert data["is_active"] is False
+    category = read_bia_category(response)
+    assert category.id == category_id
+    assert category.is_active is False
 
 async def test_list_bia_categories_excludes_inactive_by_default(
-    bcm_manager_bia_category_client: AsyncClient,
-    async_db_session: AsyncSession
+    bcm_manager_bia_category_client: AsyncClient
 ):
     active_name = "Active BIA Cat for List Filter"
     inactive_name = "Inactive BIA Cat for List Filter"
@@ -437,7 +410,7 @@ async def test_list_bia_categories_excludes_inactive_by_default(
     
     # Create one and make it inactive
     inactive_res = await bcm_manager_bia_category_client.post("/api/v1/bia-categories/", json=get_bia_category_create_payload(name=inactive_name))
-    inactive_id = inactive_res.json()["id"]
+    inactive_id = read_bia_category(inactive_res).id
     await bcm_manager_bia_category_client.put(f"/api/v1/bia-categories/{inactive_id}", json={"is_active": False})
 
     response = await bcm_manager_bia_category_client.get("/api/v1/bia-categories/")
@@ -457,15 +430,14 @@ async def test_list_bia_categories_excludes_inactive_by_default(
     assert found_inactive is False # Default list should not include inactive items
 
 async def test_list_bia_categories_can_include_inactive_with_param(
-    bcm_manager_bia_category_client: AsyncClient,
-    async_db_session: AsyncSession
+    bcm_manager_bia_category_client: AsyncClient
 ):
     active_name = "Active BIA Cat for List Param"
     inactive_name = "Inactive BIA Cat for List Param"
 
     await bcm_manager_bia_category_client.post("/api/v1/bia-categories/", json=get_bia_category_create_payload(name=active_name))
     inactive_res = await bcm_manager_bia_category_client.post("/api/v1/bia-categories/", json=get_bia_category_create_payload(name=inactive_name))
-    inactive_id = inactive_res.json()["id"]
+    inactive_id = read_bia_category(inactive_res).id
     await bcm_manager_bia_category_client.put(f"/api/v1/bia-categories/{inactive_id}", json={"is_active": False})
 
     response = await bcm_manager_bia_category_client.get("/api/v1/bia-categories/?include_inactive=true")
@@ -3,10 +3,16 @@
 import pytest
 import pytest_asyncio
 import asyncio
+import functools
 import os
 import sys
 from pathlib import Path
 
+try:
+    import uvloop # Installed with uvicorn[standard]; not available on Windows
+except ImportError:
+    uvloop = None
+
 # sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..'))) # Removed for running pytest from backend dir
 # print(f"CONFTES_SYS_PATH_AFTER_INSERT: {sys.path}") # DEBUG_SYS_PATH
 
@@ -36,10 +42,13 @@ os.environ['ASYNC_DATABASE_URL'] = ASYNC_TEST_DB_URL
 os.environ['DATABASE_URL'] = SYNC_TEST_DB_URL  # Set sync URL too if used by any part of app
 
 # Ensure the FastAPI settings object sees these test URLs
+from passlib.context import CryptContext
 from app.config import settings as app_settings
 app_settings.ASYNC_TEST_DB_URL = ASYNC_TEST_DB_URL
 app_settings.SYNC_TEST_DB_URL = SYNC_TEST_DB_URL
 app_settings.TEST_DB_PATH = TEST_DB_PATH
+# Test users don't need real bcrypt hashes; plaintext keeps per-user provisioning cheap.
+app_settings.PWD_CONTEXT = CryptContext(schemes=["plaintext"])
 
 # Import app-specific modules after setting environment variables
 from fastapi import FastAPI
@@ -63,7 +72,9 @@ from app.models.domain.roles import Role as DomainRoleModel
 from app.models.domain.permissions import Permission as PermissionDB
 from app.schemas.role import RoleName as UserRole # For authenticated clients
 from app.core.security import create_access_token # For authenticated clients
+from app.apis import deps # For overriding the current-user dependency
 from app.config import settings # For JWT settings, DEFAULT_ORG_ID etc.
+from app.tests.helpers import SECONDARY_ORG_ID, SECONDARY_ORG_NAME
 
 # --- Constants ---
 
@@ -98,8 +109,11 @@ ALL_BIA_CATEGORY_PERMISSIONS = [
 SQLITE_BUSY_TIMEOUT_MS = 15000  # milliseconds
 logger = logging.getLogger(__name__)
 
-# Define the log file path at the top, relative to this conftest.py file
-LOG_FILE_PATH = Path(__file__).parent / "test_run.log"
+# Define the log file path at the top, relative to this conftest.py file.
+# Under pytest-xdist (`pytest -n auto`) each worker writes its own log so they don't truncate each other's.
+# The database needs no such split: every worker process gets its own in-memory SQLite engine.
+_XDIST_WORKER = os.environ.get("PYTEST_XDIST_WORKER")
+LOG_FILE_PATH = Path(__file__).parent / (f"test_run_{_XDIST_WORKER}.log" if _XDIST_WORKER else "test_run.log")
 
 # Use DEFAULT_ORG_ID from settings if available, otherwise define it
 # Ensure this matches how your application expects/defines it.
@@ -188,8 +202,10 @@ async def create_test_permission(db: AsyncSession, name: str, description: str)
 @pytest_asyncio.fixture(scope="session")
 async def async_db_session_for_session_scope(db_engine: AsyncEngine):
     """Yield an async database session for session-scoped fixtures."""
+    # expire_on_commit=False keeps committed objects (e.g. seeded users) usable by later tests
+    # without triggering a lazy refresh outside of this session's async context.
     TestAsyncSessionLocal = async_sessionmaker(
-        autocommit=False, autoflush=False, bind=db_engine, class_=AsyncSession
+        autocommit=False, autoflush=False, expire_on_commit=False, bind=db_engine, class_=AsyncSession
     )
     async with TestAsyncSessionLocal() as session:
         logger.info("Yielding session-scoped async DB session.")
@@ -229,6 +245,20 @@ async def root_organization(async_db_session_for_session_scope: AsyncSession) ->
     logger.info(f"Root organization {organization.id} ({organization.name}) is now available for the session.")
     return organization
 
+@pytest_asyncio.fixture(scope="session")
+async def secondary_organization(async_db_session_for_session_scope: AsyncSession, root_organization: OrganizationDB) -> OrganizationDB:
+    """
+    Provides a second organization (SECONDARY_ORG_ID), committed once per session, for tests that
+    need data belonging to a different tenant than the default organization.
+    """
+    organization = await async_db_session_for_session_scope.get(OrganizationDB, SECONDARY_ORG_ID)
+    if not organization:
+        organization = OrganizationDB(id=SECONDARY_ORG_ID, name=SECONDARY_ORG_NAME, is_active=True)
+        async_db_session_for_session_scope.add(organization)
+        await async_db_session_for_session_scope.commit()
+        logger.info(f"Created secondary organization {organization.id} ({organization.name}).")
+    return organization
+
 @pytest_asyncio.fixture(scope="session", autouse=True)
 async def create_bia_impact_criteria_permissions_globally(async_db_session_for_session_scope: AsyncSession, root_organization: OrganizationDB):
     """Ensures all BIA Impact Criteria permissions are created once per session."""
@@ -253,15 +283,11 @@ async def create_bia_category_permissions_globally(async_db_session_for_session_
         )
     logger.info("Finished creating BIA Category permissions globally.")
 
-import asyncio
-import pytest
-
 # Session-scoped event_loop for pytest-asyncio.
 @pytest.fixture(scope="session")
 def event_loop():
-    """Create an instance of the default event loop for each test session."""
-    policy = asyncio.get_event_loop_policy()
-    loop = policy.new_event_loop()
+    """Create an event loop for the test session, using uvloop when it is installed."""
+    loop = uvloop.new_event_loop() if uvloop is not None else asyncio.get_event_loop_policy().new_event_loop()
     asyncio.set_event_loop(loop)
     yield loop
     loop.close()
@@ -277,9 +303,12 @@ async def db_engine(event_loop) -> AsyncGenerator[AsyncEngine, None]:
     engine: Optional[AsyncEngine] = None
 
     try:
-        if os.path.exists(db_file_path):
+        in_memory = ":memory:" in async_test_db_url
+        if in_memory:
+            logger.info("db_engine: Using in-memory test database; no database file to reset.")
+        elif os.path.exists(db_file_path):
             logger.info(f"db_engine: Deleting existing test database: {db_file_path}")
-            os.remove(db_file_path)
+            db_file_path.unlink(missing_ok=True) # Another xdist worker may have removed it first
         else:
             logger.info(f"db_engine: Test database {db_file_path} not found, will be created.")
 
@@ -296,15 +325,28 @@ async def db_engine(event_loop) -> AsyncGenerator[AsyncEngine, None]:
             logger.info(f"set_sqlite_pragmas: Configuring PRAGMAs for new connection.")
             try:
                 cursor = dbapi_connection.cursor()
-                cursor.execute("PRAGMA journal_mode=WAL;")
                 cursor.execute("PRAGMA foreign_keys=ON;")
-                cursor.execute(f"PRAGMA busy_timeout = {sqlite_busy_timeout_ms};")
+                if not in_memory:
+                    # WAL and busy_timeout only matter for a database file shared between connections
+                    cursor.execute("PRAGMA journal_mode=WAL;")
+                    cursor.execute(f"PRAGMA busy_timeout = {sqlite_busy_timeout_ms};")
                 cursor.close()
-                logger.info(f"set_sqlite_pragmas: PRAGMAs (WAL, foreign_keys, busy_timeout) set.")
+                logger.info(f"set_sqlite_pragmas: PRAGMAs set (foreign_keys{'' if in_memory else ', WAL, busy_timeout'}).")
             except Exception as e_pragma:
                 logger.error(f"set_sqlite_pragmas: Error setting PRAGMAs: {e_pragma}", exc_info=True)
                 raise
 
+        # pysqlite/aiosqlite issue their own BEGIN lazily and ignore SAVEPOINT semantics, so
+        # async_db_session's create_savepoint mode would not isolate tests. Disable the driver's
+        # transaction handling and emit BEGIN ourselves, as documented for the SQLite dialect.
+        @event.listens_for(engine.sync_engine, "connect")
+        def disable_driver_transactions(dbapi_connection, connection_record):
+            dbapi_connection.isolation_level = None
+
+        @event.listens_for(engine.sync_engine, "begin")
+        def emit_begin(conn):
+            conn.exec_driver_sql("BEGIN")
+
         logger.info("db_engine: SQLite PRAGMA event listener configured.")
 
         async with engine.begin() as conn:
@@ -347,12 +389,25 @@ async def db_engine(event_loop) -> AsyncGenerator[AsyncEngine, None]:
     logger.info("db_engine: Session-scoped database engine setup complete. END")
 
 @pytest_asyncio.fixture(scope="function")
-async def async_db_session(db_engine: AsyncEngine) -> AsyncGenerator[AsyncSession, None]:
+async def async_db_session(
+    db_engine: AsyncEngine, async_db_session_for_session_scope: AsyncSession
+) -> AsyncGenerator[AsyncSession, None]:
     """
     Function-scoped fixture to provide a clean database session with a transaction
     for each test. Rolls back the transaction after the test, ensuring test isolation.
     This is the standard pattern for testing with SQLAlchemy.
+
+    The session works inside a SAVEPOINT on the outer transaction, so commits and
+    rollbacks issued by application code only release or undo that savepoint; every
+    row a test creates is discarded by the single outer rollback at teardown.
     """
+    # StaticPool hands every engine connection the same SQLite connection, and the session-scoped
+    # seeding fixtures leave their session inside a transaction; end it before emitting our BEGIN.
+    # This relies on pytest setting up session-scoped fixtures before function-scoped ones: every
+    # session-scoped seeding fixture must run before any function-scoped DB fixture, because a
+    # seeding fixture that wrote through the shared connection while this test's transaction is
+    # open would nest a BEGIN and fail (or be rolled back with the test).
+    await async_db_session_for_session_scope.commit()
     connection = await db_engine.connect()
     trans = await connection.begin()
 
@@ -362,6 +417,7 @@ async def async_db_session(db_engine: AsyncEngine) -> AsyncGenerator[AsyncSessio
         autoflush=False,
         expire_on_commit=False,
         class_=AsyncSession,
+        join_transaction_mode="create_savepoint",
     )
     session = TestAsyncSessionLocal()
 
@@ -391,8 +447,8 @@ async def app(async_db_session: AsyncSession) -> AsyncGenerator[FastAPI, Any]:
 
 import pytest # Ensure pytest is imported if used in the class
 import json # For formatting error output
-from httpx import AsyncClient, Response, ASGITransport # Ensure Response is imported
-from fastapi import FastAPI # Ensure FastAPI is imported
+from httpx import AsyncClient, Response, ASGITransport, Headers # Ensure Response is imported
+from fastapi import FastAPI, HTTPException, Request, status # Ensure FastAPI is imported
 from typing import AsyncGenerator, Any # Ensure Any is imported
 
 class DebuggingAsyncClientWrapper:
@@ -403,6 +459,9 @@ class DebuggingAsyncClientWrapper:
 
     def __init__(self, client: "httpx.AsyncClient"):
         self._client = client
+        # Per-wrapper headers (e.g. Authorization) so that wrappers sharing one underlying
+        # client do not leak credentials into each other or into later tests.
+        self.headers = Headers()
 
     def __getattr__(self, name: str) -> Any:
         """
@@ -413,11 +472,19 @@ class DebuggingAsyncClientWrapper:
         return getattr(self._client, name)
 
     async def request(
-        self, method: str, url: str, expect_error: bool = False, **kwargs
+        self, method: str, url: str, *, expect_error: bool = False, **kwargs
     ) -> "httpx.Response":
         """
         Makes a request and handles debugging for error responses.
+        `expect_error` only decides whether a 4xx/5xx response fails the test; it is consumed here
+        and never forwarded to httpx. There is deliberately no retry/backoff layer, so negative-path
+        tests return as soon as the app has answered once.
         """
+        if self.headers:
+            # Per-call headers may be a dict, a list of tuples or an httpx.Headers; normalize before merging
+            headers = Headers(self.headers)
+            headers.update(kwargs.get("headers") or {})
+            kwargs["headers"] = headers
         # Make the actual request
         response = await self._client.request(method, url, **kwargs)
 
@@ -470,33 +537,106 @@ class DebuggingAsyncClientWrapper:
     async def options(self, url: str, **kwargs: Any) -> "httpx.Response":
         return await self.request("OPTIONS", url, **kwargs)
 
-@pytest_asyncio.fixture(scope="function")
-async def async_client(
-    app: FastAPI,
-) -> AsyncGenerator[DebuggingAsyncClientWrapper, None]:
+class RoleClient(DebuggingAsyncClientWrapper):
     """
-    Fixture to provide a debugging httpx.AsyncClient wrapper for making requests to the test app.
-    This uses the ASGITransport to test the app directly without a running server.
-    The wrapper automatically prints detailed error info for 422/500 responses.
+    A debugging client bound to a specific user, resolved by overriding deps.get_current_active_user.
+
+    Use it as an async context manager: entering registers the user and, for the first active
+    RoleClient, installs the override; exiting the last one restores whatever override was there
+    before. Each RoleClient tags its requests with ROLE_CLIENT_HEADER, so several of them can share
+    one underlying httpx.AsyncClient side by side, and untagged requests (e.g. plain async_client
+    calls) are rejected with 401 instead of silently authenticating as a RoleClient user.
     """
-    transport = ASGITransport(app=app)
+
+    ROLE_CLIENT_HEADER = "X-Test-Role-Client"
+    _active_users: dict = {}
+    _previous_override: Optional[Callable] = None
+
+    def __init__(self, client: "httpx.AsyncClient", user: UserDB):
+        super().__init__(client)
+        self.user = user
+        self.headers[self.ROLE_CLIENT_HEADER] = str(user.id)
+
+    @classmethod
+    def _resolve_user(cls, request: Request) -> UserDB:
+        user = cls._active_users.get(request.headers.get(cls.ROLE_CLIENT_HEADER))
+        if user is None:
+            raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Could not validate credentials")
+        return user
+
+    async def __aenter__(self) -> "RoleClient":
+        overrides = fastapi_app.dependency_overrides
+        if not RoleClient._active_users:
+            RoleClient._previous_override = overrides.get(deps.get_current_active_user)
+            overrides[deps.get_current_active_user] = RoleClient._resolve_user
+        RoleClient._active_users[str(self.user.id)] = self.user
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        RoleClient._active_users.pop(str(self.user.id), None)
+        if RoleClient._active_users:
+            return
+        overrides = fastapi_app.dependency_overrides
+        if RoleClient._previous_override is not None:
+            overrides[deps.get_current_active_user] = RoleClient._previous_override
+        else:
+            overrides.pop(deps.get_current_active_user, None)
+        RoleClient._previous_override = None
+
+@pytest_asyncio.fixture(scope="session")
+async def shared_http_client() -> AsyncGenerator[AsyncClient, None]:
+    """
+    Session-scoped httpx.AsyncClient shared by every test client wrapper.
+    This uses the ASGITransport to test the app directly without a running server: requests are
+    dispatched in-process, so no Uvicorn server, TCP socket or HTTP framing is involved.
+    Per-test state (DB session override, auth) lives in the app's dependency overrides and in
+    the wrappers, never on this client.
+    """
+    # raise_app_exceptions=True surfaces unhandled app errors as the original exception
+    # instead of an opaque 500, which is what we want when debugging tests.
+    transport = ASGITransport(app=fastapi_app, raise_app_exceptions=True)
     client = AsyncClient(transport=transport, base_url="http://testserver")
     try:
-        yield DebuggingAsyncClientWrapper(client)
+        yield client
     finally:
         await client.aclose()
 
+@pytest_asyncio.fixture(scope="function")
+async def async_client(
+    app: FastAPI,
+    shared_http_client: AsyncClient,
+) -> DebuggingAsyncClientWrapper:
+    """
+    Fixture to provide a debugging httpx.AsyncClient wrapper for making requests to the test app.
+    Requests go through the session-wide shared_http_client; depending on `app` makes sure the
+    test's DB session override is installed. The wrapper automatically prints detailed error
+    info for 422/500 responses.
+    """
+    return DebuggingAsyncClientWrapper(shared_http_client)
+
 
 # --- Authenticated Client Fixtures (Example) ---
 
+@functools.lru_cache(maxsize=None)
+def _cached_access_token(user_id: str, organization_id: str, scopes: tuple) -> str:
+    """
+    Mints one JWT per (user, org, scopes) for the whole session. Test users are rolled back
+    after every test but come back with the same id, so their token can be reused.
+    Tokens live ACCESS_TOKEN_EXPIRE_MINUTES, far longer than a test run.
+    """
+    return create_access_token(data={"sub": user_id, "organization_id": organization_id, "scopes": list(scopes)})
+
 @pytest_asyncio.fixture(scope="function")
 async def async_client_authenticated_as_user_factory(
     async_client: "DebuggingAsyncClientWrapper", async_db_session: AsyncSession
 ) -> Callable:
     """
     Factory fixture to create an authenticated client for a given user.
-    Creates the user if they don't exist.
+    Creates the user if they don't exist. Repeated calls with the same arguments within
+    a test reuse the first result instead of re-provisioning and re-hashing.
     """
+    provisioned: dict = {}
+
     async def _create_authenticated_client(
         user_identifier: Union[User, str],
         password: str = "testpassword",
@@ -505,6 +645,17 @@ async def async_client_authenticated_as_user_factory(
         permissions_to_assign_to_role: Optional[List[str]] = None # Added for dynamic permission assignment to role
     ):
         logger = logging.getLogger(__name__)
+        cache_key = (
+            user_identifier.email if isinstance(user_identifier, User) else user_identifier,
+            role_override,
+            organization_id_override,
+            frozenset(permissions_to_assign_to_role or ()),
+        )
+        if cache_key in provisioned:
+            access_token, db_user = provisioned[cache_key]
+            async_client.headers["Authorization"] = f"Bearer {access_token}"
+            return async_client, access_token, db_user
+
         effective_email: str
         effective_role_name: str
         effective_organization_id: uuid.UUID
@@ -528,7 +679,9 @@ async def async_client_authenticated_as_user_factory(
 
         if not db_user:
             db_user = UserDB(
-                id=uuid.uuid4(),
+                # Deterministic per (org, email) so the same test user gets the same id, and
+                # therefore the same cached token, every time a test re-creates it.
+                id=uuid.uuid5(uuid.NAMESPACE_URL, f"{effective_organization_id}/{effective_email}"),
                 first_name="Test",  # Default value, matches SQLAlchemy model attribute
                 last_name="User",   # Default value, matches SQLAlchemy model attribute
                 email=effective_email,
@@ -628,60 +781,77 @@ async def async_client_authenticated_as_user_factory(
 
         logger.info(f"_create_authenticated_client: Preparing token for user: id={db_user.id}, org_id={db_user.organization_id}, email='{db_user.email}', is_active={db_user.is_active}, roles={[r.name for r in db_user.roles if r]}")
 
-        token_data = {
-            "sub": str(db_user.id),  # Use user's UUID as the subject, converted to string
-            "organization_id": str(db_user.organization_id),  # Convert org UUID to string
-            "scopes": [p.name for p in user_permissions]
-        }
-        access_token = create_access_token(data=token_data)
+        access_token = _cached_access_token(
+            str(db_user.id),  # Use user's UUID as the subject, converted to string
+            str(db_user.organization_id),  # Convert org UUID to string
+            tuple(p.name for p in user_permissions)
+        )
         
         async_client.headers["Authorization"] = f"Bearer {access_token}"
         logger.info(f"Authenticated client configured for user '{effective_email}' with role '{effective_role_name}'.")
+        provisioned[cache_key] = (access_token, db_user)
         return async_client, access_token, db_user # Return all three
 
     return _create_authenticated_client
 
 
+async def _role_client(factory: Callable, shared_http_client: AsyncClient, **user_kwargs) -> DebuggingAsyncClientWrapper:
+    """
+    Provisions the user through the factory and returns a wrapper over the session-wide client
+    that carries that user's token. Each role gets its own wrapper, so tests mixing roles
+    don't overwrite each other's Authorization header.
+    """
+    _ignored_client, access_token, _user = await factory(**user_kwargs)
+    client = DebuggingAsyncClientWrapper(shared_http_client)
+    client.headers["Authorization"] = f"Bearer {access_token}"
+    return client
+
+
 @pytest_asyncio.fixture(scope="function")
-async def ciso_user_authenticated_client(async_client_authenticated_as_user_factory):
+async def ciso_user_authenticated_client(async_client_authenticated_as_user_factory, shared_http_client) -> DebuggingAsyncClientWrapper:
     """Authenticated client for a CISO user."""
-    return await async_client_authenticated_as_user_factory(
+    return await _role_client(
+        async_client_authenticated_as_user_factory, shared_http_client,
         user_identifier="ciso@example.com", 
         role_override=UserRole.CISO,
         organization_id_override=DEFAULT_ORG_ID
     )
 
 @pytest_asyncio.fixture(scope="function")
-async def admin_user_authenticated_client(async_client_authenticated_as_user_factory):
+async def admin_user_authenticated_client(async_client_authenticated_as_user_factory, shared_http_client) -> DebuggingAsyncClientWrapper:
     """Authenticated client for an ADMIN user."""
-    return await async_client_authenticated_as_user_factory(
+    return await _role_client(
+        async_client_authenticated_as_user_factory, shared_http_client,
         user_identifier="admin@example.com", 
         role_override=UserRole.ADMIN,
         organization_id_override=DEFAULT_ORG_ID
     )
 
 @pytest_asyncio.fixture(scope="function")
-async def bcm_manager_user_authenticated_client(async_client_authenticated_as_user_factory):
+async def bcm_manager_user_authenticated_client(async_client_authenticated_as_user_factory, shared_http_client) -> DebuggingAsyncClientWrapper:
     """Authenticated client for a BCM_MANAGER user."""
-    return await async_client_authenticated_as_user_factory(
+    return await _role_client(
+        async_client_authenticated_as_user_factory, shared_http_client,
         user_identifier="bcm_manager@example.com", 
         role_override=UserRole.BCM_MANAGER,
         organization_id_override=DEFAULT_ORG_ID
     )
 
 @pytest_asyncio.fixture(scope="function")
-async def internal_auditor_user_authenticated_client(async_client_authenticated_as_user_factory):
+async def internal_auditor_user_authenticated_client(async_client_authenticated_as_user_factory, shared_http_client) -> DebuggingAsyncClientWrapper:
     """Authenticated client for an INTERNAL_AUDITOR user."""
-    return await async_client_authenticated_as_user_factory(
+    return await _role_client(
+        async_client_authenticated_as_user_factory, shared_http_client,
         user_identifier="internal_auditor@example.com", 
         role_override=UserRole.INTERNAL_AUDITOR,
         organization_id_override=DEFAULT_ORG_ID
     )
 
 @pytest_asyncio.fixture(scope="function")
-async def general_user_authenticated_client(async_client_authenticated_as_user_factory):
+async def general_user_authenticated_client(async_client_authenticated_as_user_factory, shared_http_client) -> DebuggingAsyncClientWrapper:
     """Authenticated client for a general USER role."""
-    return await async_client_authenticated_as_user_factory(
+    return await _role_client(
+        async_client_authenticated_as_user_factory, shared_http_client,
         user_identifier="general_user@example.com", 
         role_override=UserRole.USER,
         organization_id_override=DEFAULT_ORG_ID
@@ -884,133 +1054,128 @@ async def test_user_without_bia_create_permission(standard_user_bia_setup) -> Us
 
 # --- BIA Category Test Users & Clients ---
 
-@pytest_asyncio.fixture(scope="function")
-async def bcm_manager_bia_category_setup(
-    async_client_authenticated_as_user_factory,
+# Seeded once per session: key -> (email, role name, permissions assigned to the role).
+# Role names are unique across the whole DB, so these roles are dedicated to the BIA Category
+# tests rather than reusing the shared RoleName values other tests create per-test.
+BIA_CATEGORY_SEEDED_USERS = {
+    "bcm_manager": ("bcm_manager_for_bia_category@example.com", "BIA Category Manager", ALL_BIA_CATEGORY_PERMISSIONS),
+    "ciso": ("ciso_for_bia_category@example.com", "BIA Category CISO", ALL_BIA_CATEGORY_PERMISSIONS),
+    "read_only": ("readonly_user_for_bia_category@example.com", "BIA Category Reader", [BIA_CATEGORY_READ]),
+    "none": ("noperms_user_for_bia_category@example.com", "BIA Category No Access", []),
+}
+
+@pytest_asyncio.fixture(scope="session")
+async def bia_category_seeded_users(
+    async_db_session_for_session_scope: AsyncSession,
+    root_organization: OrganizationDB,
     create_bia_category_permissions_globally # Ensure permissions are created
-):
+) -> dict:
     """
-    Sets up a BCM Manager user with all BIA Category permissions.
-    Uses a unique email.
-    Returns a tuple (client, token, user_object).
+    Creates the four BIA Category test users (and a dedicated role for each) once per session.
+    Returns a dict keyed like BIA_CATEGORY_SEEDED_USERS with fully loaded UserDB objects.
     """
-    return await async_client_authenticated_as_user_factory(
-        user_identifier="bcm_manager_for_bia_category@example.com", 
-        role_override=UserRole.BCM_MANAGER,
-        organization_id_override=DEFAULT_ORG_ID,
-        permissions_to_assign_to_role=ALL_BIA_CATEGORY_PERMISSIONS
+    session = async_db_session_for_session_scope
+    await session.flush() # Persist the globally created permissions so they can be queried
+    perm_result = await session.execute(
+        select(PermissionDB).where(PermissionDB.name.in_(ALL_BIA_CATEGORY_PERMISSIONS))
     )
+    permissions_by_name = {p.name: p for p in perm_result.scalars()}
+
+    seeded_users = {}
+    for key, (email, role_name, permission_names) in BIA_CATEGORY_SEEDED_USERS.items():
+        role = DomainRoleModel(
+            name=role_name,
+            organization_id=DEFAULT_ORG_ID,
+            permissions=[permissions_by_name[name] for name in permission_names],
+        )
+        user = UserDB(
+            id=uuid.uuid4(),
+            first_name="Test",
+            last_name="User",
+            email=email,
+            password_hash=settings.PWD_CONTEXT.hash("testpassword"),
+            is_active=True,
+            organization_id=DEFAULT_ORG_ID,
+            roles=[role],
+        )
+        session.add(user)
+        seeded_users[key] = user
+    await session.commit()
+    logger.info(f"Seeded BIA Category test users: {[u.email for u in seeded_users.values()]}")
+    return seeded_users
+
+@pytest_asyncio.fixture(scope="function")
+async def bcm_manager_bia_category_setup(app, shared_http_client, bia_category_seeded_users):
+    """
+    Provides a RoleClient for the seeded BCM Manager with all BIA Category permissions.
+    Returns a tuple (client, user_object).
+    """
+    async with RoleClient(shared_http_client, bia_category_seeded_users["bcm_manager"]) as client:
+        yield client, client.user
 
 @pytest_asyncio.fixture(scope="function")
 async def bcm_manager_bia_category_client(bcm_manager_bia_category_setup):
     """Provides an authenticated client for a BCM Manager with BIA Category permissions."""
     return bcm_manager_bia_category_setup[0]
 
-@pytest_asyncio.fixture(scope="function")
-async def bcm_manager_bia_category_token(bcm_manager_bia_category_setup):
-    """Provides an access token for a BCM Manager with BIA Category permissions."""
-    return bcm_manager_bia_category_setup[1]
-
 @pytest_asyncio.fixture(scope="function")
 async def bcm_manager_bia_category_user(bcm_manager_bia_category_setup) -> UserDB:
     """Provides a UserDB object for a BCM Manager with BIA Category permissions."""
-    return bcm_manager_bia_category_setup[2]
+    return bcm_manager_bia_category_setup[1]
 
 @pytest_asyncio.fixture(scope="function")
-async def ciso_bia_category_setup(
-    async_client_authenticated_as_user_factory,
-    create_bia_category_permissions_globally # Ensure permissions are created
-):
+async def ciso_bia_category_setup(app, shared_http_client, bia_category_seeded_users):
     """
-    Sets up a CISO user with all BIA Category permissions.
-    Uses a unique email.
-    Returns a tuple (client, token, user_object).
+    Provides a RoleClient for the seeded CISO with all BIA Category permissions.
+    Returns a tuple (client, user_object).
     """
-    return await async_client_authenticated_as_user_factory(
-        user_identifier="ciso_for_bia_category@example.com", 
-        role_override=UserRole.CISO,
-        organization_id_override=DEFAULT_ORG_ID,
-        permissions_to_assign_to_role=ALL_BIA_CATEGORY_PERMISSIONS
-    )
+    async with RoleClient(shared_http_client, bia_category_seeded_users["ciso"]) as client:
+        yield client, client.user
 
 @pytest_asyncio.fixture(scope="function")
 async def ciso_bia_category_client(ciso_bia_category_setup):
     """Provides an authenticated client for a CISO with BIA Category permissions."""
     return ciso_bia_category_setup[0]
 
-@pytest_asyncio.fixture(scope="function")
-async def ciso_bia_category_token(ciso_bia_category_setup):
-    """Provides an access token for a CISO with BIA Category permissions."""
-    return ciso_bia_category_setup[1]
-
 @pytest_asyncio.fixture(scope="function")
 async def ciso_bia_category_user(ciso_bia_category_setup) -> UserDB:
     """Provides a UserDB object for a CISO with BIA Category permissions."""
-    return ciso_bia_category_setup[2]
+    return ciso_bia_category_setup[1]
 
 @pytest_asyncio.fixture(scope="function")
-async def read_only_bia_category_user_setup(
-    async_client_authenticated_as_user_factory,
-    create_bia_category_permissions_globally
-):
+async def read_only_bia_category_user_setup(app, shared_http_client, bia_category_seeded_users):
     """
-    Sets up a standard USER with only BIA Category read permissions.
-    Uses a unique email.
-    Returns a tuple (client, token, user_object).
+    Provides a RoleClient for the seeded standard user with only BIA Category read permissions.
+    Returns a tuple (client, user_object).
     """
-    return await async_client_authenticated_as_user_factory(
-        user_identifier="readonly_user_for_bia_category@example.com", 
-        role_override=UserRole.USER, # Standard user
-        organization_id_override=DEFAULT_ORG_ID,
-        permissions_to_assign_to_role=[BIA_CATEGORY_READ]
-    )
+    async with RoleClient(shared_http_client, bia_category_seeded_users["read_only"]) as client:
+        yield client, client.user
 
 @pytest_asyncio.fixture(scope="function")
 async def read_only_bia_category_client(read_only_bia_category_user_setup):
     """Provides an authenticated client for a user with read-only BIA Category permissions."""
     return read_only_bia_category_user_setup[0]
 
-@pytest_asyncio.fixture(scope="function")
-async def read_only_bia_category_token(read_only_bia_category_user_setup):
-    """Provides an access token for a user with read-only BIA Category permissions."""
-    return read_only_bia_category_user_setup[1]
-
 @pytest_asyncio.fixture(scope="function")
 async def read_only_bia_category_user(read_only_bia_category_user_setup) -> UserDB:
     """Provides a UserDB object for a user with read-only BIA Category permissions."""
-    return read_only_bia_category_user_setup[2]
+    return read_only_bia_category_user_setup[1]
 
 @pytest_asyncio.fixture(scope="function")
-async def no_bia_category_permissions_user_setup(
-    async_client_authenticated_as_user_factory,
-    create_bia_category_permissions_globally
-):
+async def no_bia_category_permissions_user_setup(app, shared_http_client, bia_category_seeded_users):
     """
-    Sets up a standard USER with NO BIA Category permissions.
-    Uses a unique email.
-    Returns a tuple (client, token, user_object).
+    Provides a RoleClient for the seeded standard user with NO BIA Category permissions.
+    Returns a tuple (client, user_object).
     """
-    return await async_client_authenticated_as_user_factory(
-        user_identifier="noperms_user_for_bia_category@example.com", 
-        role_override=UserRole.USER, # Standard user
-        organization_id_override=DEFAULT_ORG_ID,
-        permissions_to_assign_to_role=[] # Explicitly no BIA Category permissions
-    )
+    async with RoleClient(shared_http_client, bia_category_seeded_users["none"]) as client:
+        yield client, client.user
 
 @pytest_asyncio.fixture(scope="function")
 async def no_bia_category_permissions_client(no_bia_category_permissions_user_setup):
     """Provides an authenticated client for a user with no BIA Category permissions."""
     return no_bia_category_permissions_user_setup[0]
 
-@pytest_asyncio.fixture(scope="function")
-async def no_bia_category_permissions_token(no_bia_category_permissions_user_setup):
-    """Provides an access token for a user with no BIA Category permissions."""
-    return no_bia_category_permissions_user_setup[1]
-
 @pytest_asyncio.fixture(scope="function")
 async def no_bia_category_permissions_user(no_bia_category_permissions_user_setup) -> UserDB:
     """Provides a UserDB object for a user with no BIA Category permissions."""
-    return no_bia_category_permissions_user_setup[2]
-
-
-
+    return no_bia_category_permissions_user_setup[1]
@@ -1,19 +1,30 @@
 import uuid
-from typing import List
+from typing import Any, List
+
+import orjson
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
 from sqlalchemy.orm import joinedload
+from httpx import Response
 
 # App specific imports
 from app.models.domain.users import User as UserModel
 from app.models.domain.roles import Role as RoleModel
 from app.models.domain.permissions import Permission as PermissionModel
 from app.models.domain.organizations import Organization as OrganizationModel
+from app.schemas.bia_categories import BIACategoryRead
 
 # Define static UUIDs for default entities
 DEFAULT_ORG_ID = uuid.UUID("00000000-0000-0000-0000-000000000001")
 DEFAULT_USER_ID = uuid.UUID("00000000-0000-0000-0000-000000000002")
 DEFAULT_ORG_NAME = "Default Test Organization"
+# Second organization seeded once per session for cross-tenant tests (see secondary_organization fixture)
+SECONDARY_ORG_ID = uuid.UUID("00000000-0000-0000-0000-000000000003")
+SECONDARY_ORG_NAME = "Secondary Test Organization"
+
+# API routes shared by the BIA framework and impact criterion test modules
+BIA_IMPACT_CRITERIA_API_URL = "/api/v1/bia-impact-criteria/"
+BIA_FRAMEWORKS_API_URL = "/api/v1/bia-frameworks/"
 
 async def _ensure_default_organization(session: AsyncSession, org_id: uuid.UUID, org_name: str = "Default Test Organization") -> OrganizationModel:
     stmt = select(OrganizationModel).where(OrganizationModel.id == org_id)
@@ -119,3 +130,11 @@ async def create_user_with_roles_async(
         # This should ideally not happen if flush was successful and user_id is valid
         raise RuntimeError(f"Failed to re-fetch user with ID {user_id} after creation.")
     return refetched_user
+
+def read_bia_category(response: Response) -> BIACategoryRead:
+    """Parses and validates a single BIA category response body in one pass (no intermediate dict)."""
+    return BIACategoryRead.model_validate_json(response.content)
+
+def read_json(response: Response) -> Any:
+    """Decodes a response body with orjson; a faster drop-in for response.json()."""
+    return orjson.loads(response.content)